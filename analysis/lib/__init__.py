@@ -2,12 +2,17 @@
 Analysis 라이브러리 모듈
 
 공통 분석 기능을 제공하는 모듈 모음
+
+하위 모듈은 처음 접근할 때 로드합니다 (plots의 matplotlib 등 무거운
+의존성을 요약 생성만 할 때는 불러오지 않기 위함).
 """
 
-from . import loader
-from . import metrics
-from . import plots
-from . import report
-from . import summarize
+import importlib
 
 __all__ = ['loader', 'metrics', 'plots', 'report', 'summarize']
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
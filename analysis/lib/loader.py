@@ -11,6 +11,14 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Generator
 from dataclasses import dataclass, field
 
+# pyarrow는 선택적 (있으면 파싱 결과를 Parquet으로 캐싱)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 @dataclass
 class ExperimentData:
@@ -58,12 +66,114 @@ def parse_jsonl_file(filepath: str) -> List[Dict[str, Any]]:
     return events
 
 
-def load_experiment(filepath: str) -> Optional[ExperimentData]:
+# Parquet 캐시 설정
+CACHE_DIR_NAME = '.cache'
+
+# 지표 계산(metrics.calculate_experiment_metrics)에 필요한 이벤트 필드만 캐싱
+CACHE_COLUMNS = [
+    ('event', 'string'),
+    ('timestamp', 'float64'),
+    ('drone_id', 'string'),
+    ('target_id', 'string'),
+    ('is_hostile', 'bool'),
+    ('behavior', 'string'),
+    ('is_false_alarm', 'bool'),
+    ('false_alarm_type', 'string'),
+    ('method', 'string'),
+    ('result', 'string'),
+    ('reason', 'string'),
+]
+
+# ExperimentData 메타데이터 필드 (Parquet 스키마 메타데이터로 저장)
+_CACHE_META_FIELDS = [
+    'experiment_id', 'scenario_id', 'seed', 'duration', 'drone_count',
+    'interceptor_count', 'audio_model_enabled', 'hostile_ratio', 'radar_config',
+]
+
+# 캐시 형식 버전 (컬럼 외의 저장 방식이 바뀌면 올림)
+CACHE_VERSION = 1
+
+# 캐시 파일이 어떤 버전/컬럼/메타 필드로 작성되었는지 기록하는 스키마 메타데이터.
+# 읽을 때 현재 값과 다르면 캐시 미스로 처리 (CACHE_COLUMNS에 필드를 추가해도
+# 기존 캐시가 새 필드 없이 로드되지 않도록)
+_CACHE_SCHEMA = json.dumps({
+    'version': CACHE_VERSION,
+    'columns': CACHE_COLUMNS,
+    'meta_fields': _CACHE_META_FIELDS,
+}).encode()
+
+
+def get_cache_path(filepath: str) -> str:
+    """JSONL 파일에 대응하는 Parquet 캐시 경로"""
+    log_dir, filename = os.path.split(filepath)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(log_dir, CACHE_DIR_NAME, f'{stem}.parquet')
+
+
+def _load_cached_experiment(filepath: str) -> Optional[ExperimentData]:
+    """
+    유효한 Parquet 캐시가 있으면 ExperimentData로 복원
+    
+    캐시가 없거나, 원본 JSONL보다 오래되었거나, 현재와 다른 캐시 스키마
+    (CACHE_VERSION/CACHE_COLUMNS/_CACHE_META_FIELDS)로 작성되었으면
+    None을 반환합니다.
+    복원된 events에는 CACHE_COLUMNS 필드만 포함됩니다.
+    """
+    cache_path = get_cache_path(filepath)
+    if not os.path.exists(cache_path):
+        return None
+    if os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+        return None
+    
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        if metadata.get(b'cache_schema') != _CACHE_SCHEMA:
+            return None
+        table = pq.read_table(cache_path, columns=[name for name, _ in CACHE_COLUMNS])
+        meta = json.loads(metadata[b'experiment'])
+    except (pa.ArrowException, OSError, KeyError, TypeError, ValueError) as e:
+        print(f"⚠️ 캐시 읽기 실패 ({cache_path}): {e}")
+        return None
+    
+    # 원본에 없던 필드(None)는 제거하여 event.get(key, default) 동작 유지
+    events = [
+        {k: v for k, v in row.items() if v is not None}
+        for row in table.to_pylist()
+    ]
+    return ExperimentData(filepath=filepath, events=events, **meta)
+
+
+def _write_experiment_cache(exp: ExperimentData) -> None:
+    """ExperimentData를 Parquet 캐시로 저장 (실패 시 경고만 출력)"""
+    cache_path = get_cache_path(exp.filepath)
+    schema = pa.schema(
+        [(name, pa.type_for_alias(dtype)) for name, dtype in CACHE_COLUMNS],
+        metadata={
+            'cache_schema': _CACHE_SCHEMA,
+            'experiment': json.dumps({k: getattr(exp, k) for k in _CACHE_META_FIELDS}),
+        },
+    )
+    
+    try:
+        columns = {
+            name: [event.get(name) for event in exp.events]
+            for name, _ in CACHE_COLUMNS
+        }
+        table = pa.Table.from_pydict(columns, schema=schema)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        pq.write_table(table, cache_path)
+    except (pa.ArrowException, OSError, TypeError) as e:
+        print(f"⚠️ 캐시 저장 실패 ({cache_path}): {e}")
+
+
+def load_experiment(filepath: str, use_cache: bool = False) -> Optional[ExperimentData]:
     """
     단일 실험 파일 로드
     
     Args:
         filepath: JSONL 파일 경로
+        use_cache: Parquet 캐시 사용 여부 (pyarrow 필요). 캐시에서 로드한
+            경우 events에는 지표 계산용 필드(CACHE_COLUMNS)만 포함됩니다.
         
     Returns:
         ExperimentData 객체 또는 None
@@ -72,6 +182,12 @@ def load_experiment(filepath: str) -> Optional[ExperimentData]:
         print(f"⚠️ 파일 없음: {filepath}")
         return None
     
+    use_cache = use_cache and HAS_PYARROW
+    if use_cache:
+        cached = _load_cached_experiment(filepath)
+        if cached:
+            return cached
+    
     events = parse_jsonl_file(filepath)
     if not events:
         return None
@@ -104,7 +220,7 @@ def load_experiment(filepath: str) -> Optional[ExperimentData]:
         elif event_type == 'scenario_end':
             duration = event.get('duration', event.get('timestamp', 0))
     
-    return ExperimentData(
+    exp = ExperimentData(
         filepath=filepath,
         experiment_id=experiment_id,
         scenario_id=scenario_id,
@@ -117,33 +233,72 @@ def load_experiment(filepath: str) -> Optional[ExperimentData]:
         hostile_ratio=hostile_ratio,
         radar_config=radar_config,
     )
+    
+    if use_cache:
+        _write_experiment_cache(exp)
+    
+    return exp
 
 
-def load_all_experiments(log_dir: str = '../simulator/logs') -> List[ExperimentData]:
+def find_experiment_files(log_dir: str = '../simulator/logs') -> List[str]:
     """
-    디렉토리의 모든 실험 파일 로드
+    디렉토리의 실험 로그(JSONL) 파일 경로 목록 (정렬됨)
     
     Args:
         log_dir: 로그 디렉토리 경로
         
     Returns:
-        ExperimentData 리스트
+        파일 경로 리스트 (없으면 경고 출력 후 빈 리스트)
     """
     pattern = os.path.join(log_dir, '*.jsonl')
     files = sorted(glob.glob(pattern))
-    
     if not files:
         print(f"⚠️ 로그 파일을 찾을 수 없습니다: {pattern}")
-        return []
+    return files
+
+
+def iter_all_experiments(
+    log_dir: str = '../simulator/logs',
+    use_cache: bool = False,
+) -> Generator[ExperimentData, None, None]:
+    """
+    디렉토리의 실험 파일을 하나씩 로드하는 제너레이터
+    
+    한 번에 하나의 ExperimentData만 메모리에 유지합니다.
     
-    experiments = []
+    Args:
+        log_dir: 로그 디렉토리 경로
+        use_cache: Parquet 캐시 사용 여부 (load_experiment 참고)
+        
+    Yields:
+        ExperimentData 객체
+    """
+    files = find_experiment_files(log_dir)
+    if not files:
+        return
+    
+    loaded = 0
     for filepath in files:
-        exp = load_experiment(filepath)
+        exp = load_experiment(filepath, use_cache=use_cache)
         if exp:
-            experiments.append(exp)
+            loaded += 1
+            yield exp
+    
+    print(f"📂 {loaded}개 실험 로드 완료")
+
+
+def load_all_experiments(log_dir: str = '../simulator/logs', use_cache: bool = False) -> List[ExperimentData]:
+    """
+    디렉토리의 모든 실험 파일 로드
     
-    print(f"📂 {len(experiments)}개 실험 로드 완료")
-    return experiments
+    Args:
+        log_dir: 로그 디렉토리 경로
+        use_cache: Parquet 캐시 사용 여부 (load_experiment 참고)
+        
+    Returns:
+        ExperimentData 리스트
+    """
+    return list(iter_all_experiments(log_dir, use_cache=use_cache))
 
 
 def filter_events(events: List[Dict[str, Any]], event_type: str) -> List[Dict[str, Any]]:
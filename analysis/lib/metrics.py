@@ -5,10 +5,11 @@
 """
 
 import statistics
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from collections import defaultdict
-from .loader import ExperimentData, filter_events
+from .loader import ExperimentData, filter_events, find_experiment_files, load_experiment
 
 
 @dataclass
@@ -525,12 +526,15 @@ def aggregate_metrics(metrics_list: List[ExperimentMetrics]) -> Dict[str, Any]:
     }
 
 
-def calculate_all_metrics(experiments: List[ExperimentData]) -> Tuple[List[ExperimentMetrics], Dict[str, Any]]:
+def calculate_all_metrics(experiments: Iterable[ExperimentData]) -> Tuple[List[ExperimentMetrics], Dict[str, Any]]:
     """
     모든 실험의 지표 계산 및 집계
     
+    제너레이터를 넘기면 실험별 이벤트는 지표 계산 직후 해제되고
+    (드론/지연 통계만 담은) ExperimentMetrics만 유지됩니다.
+    
     Args:
-        experiments: ExperimentData 리스트
+        experiments: ExperimentData 리스트 또는 이터러블
         
     Returns:
         (개별 지표 리스트, 집계 지표) 튜플
@@ -539,3 +543,39 @@ def calculate_all_metrics(experiments: List[ExperimentData]) -> Tuple[List[Exper
     aggregated = aggregate_metrics(individual_metrics)
     return individual_metrics, aggregated
 
+
+def _load_and_calculate(filepath: str, use_cache: bool = False) -> Optional[ExperimentMetrics]:
+    """단일 실험 파일 로드 + 지표 계산 (프로세스 풀 작업 함수)"""
+    exp = load_experiment(filepath, use_cache=use_cache)
+    return calculate_experiment_metrics(exp) if exp else None
+
+
+def calculate_all_metrics_parallel(
+    log_dir: str = '../simulator/logs',
+    use_cache: bool = False,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[ExperimentMetrics], Dict[str, Any]]:
+    """
+    실험 파일별 로드/지표 계산을 여러 프로세스로 병렬 수행 후 집계
+    
+    각 작업 프로세스는 ExperimentMetrics만 반환하므로 원본 이벤트는
+    메인 프로세스로 전달되지 않습니다.
+    
+    Args:
+        log_dir: 로그 디렉토리 경로
+        use_cache: Parquet 캐시 사용 여부 (loader.load_experiment 참고)
+        max_workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+        
+    Returns:
+        (개별 지표 리스트, 집계 지표) 튜플
+    """
+    files = find_experiment_files(log_dir)
+    if not files:
+        return [], {}
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_load_and_calculate, files, [use_cache] * len(files))
+        individual_metrics = [m for m in results if m is not None]
+    
+    print(f"📂 {len(individual_metrics)}개 실험 로드 완료")
+    return individual_metrics, aggregate_metrics(individual_metrics)
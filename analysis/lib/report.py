@@ -5,22 +5,11 @@
 """
 
 import os
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from .loader import load_all_experiments
-from .metrics import calculate_all_metrics
-from .summarize import generate_summary, generate_improvement_points
-
-try:
-    from .plots import (
-        create_full_report_figure, 
-        create_summary_card,
-        HAS_MATPLOTLIB
-    )
-except ImportError:
-    HAS_MATPLOTLIB = False
+from .loader import iter_all_experiments
+from .summarize import generate_summary, generate_summary_parallel, save_summary_json
 
 
 def generate_html_report(summary: Dict[str, Any], output_path: str = 'report.html'):
@@ -239,33 +228,42 @@ def generate_html_report(summary: Dict[str, Any], output_path: str = 'report.htm
     print(f"📄 HTML 보고서 저장: {output_path}")
 
 
-def generate_full_report(log_dir: str = '../simulator/logs', output_dir: str = './reports'):
+def generate_full_report(
+    log_dir: str = '../simulator/logs',
+    output_dir: str = './reports',
+    use_cache: bool = False,
+    workers: int = 1,
+):
     """
     전체 보고서 생성 (그래프 + HTML)
     
     Args:
         log_dir: 로그 디렉토리
         output_dir: 출력 디렉토리
+        use_cache: 파싱 결과 Parquet 캐시 사용 여부
+        workers: 병렬 처리 프로세스 수 (1이면 순차 스트리밍, 0이면 CPU 코어 수)
     """
     print("\n📋 보고서 생성 시작...\n")
     
     # 출력 디렉토리 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 데이터 로드 및 분석
-    experiments = load_all_experiments(log_dir)
-    if not experiments:
+    # 데이터 로드 및 분석 (실험 단위 스트리밍 또는 프로세스 병렬)
+    if workers == 1:
+        summary = generate_summary(iter_all_experiments(log_dir, use_cache=use_cache))
+    else:
+        summary = generate_summary_parallel(log_dir, use_cache=use_cache, max_workers=workers or None)
+    if not summary['metrics']:
         print("⚠️ 분석할 데이터가 없습니다.")
         return
     
-    summary = generate_summary(experiments)
-    
     # 타임스탬프
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # 그래프 생성
+    # 그래프 생성 (matplotlib은 필요할 때만 로드)
+    from .plots import HAS_MATPLOTLIB
     if HAS_MATPLOTLIB:
-        from plots import create_full_report_figure
+        from .plots import create_full_report_figure
         graph_path = os.path.join(output_dir, f'experiment_analysis.png')
         create_full_report_figure(summary['metrics'], graph_path)
     
@@ -275,8 +273,7 @@ def generate_full_report(log_dir: str = '../simulator/logs', output_dir: str = '
     
     # JSON 요약 저장
     json_path = os.path.join(output_dir, f'summary_{timestamp}.json')
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    save_summary_json(summary, json_path)
     print(f"💾 JSON 요약 저장: {json_path}")
     
     print(f"\n✅ 보고서 생성 완료!")
@@ -291,7 +288,9 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='대드론 C2 실험 보고서 생성')
     parser.add_argument('--log-dir', '-l', default='../simulator/logs', help='로그 디렉토리')
     parser.add_argument('--output-dir', '-o', default='./reports', help='출력 디렉토리')
+    parser.add_argument('--cache', action='store_true', help='파싱 결과 Parquet 캐시 사용 (pyarrow 필요)')
+    parser.add_argument('--workers', '-j', type=int, default=1, help='병렬 처리 프로세스 수 (0 = CPU 코어 수, 기본 1)')
     args = parser.parse_args()
     
-    generate_full_report(args.log_dir, args.output_dir)
+    generate_full_report(args.log_dir, args.output_dir, use_cache=args.cache, workers=args.workers)
 
@@ -4,27 +4,135 @@
 실험 결과 요약 및 개선 포인트 생성
 """
 
+import json
+import operator
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import reduce
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
 from .loader import ExperimentData
-from .metrics import calculate_all_metrics
+from .metrics import ExperimentMetrics, calculate_all_metrics, calculate_all_metrics_parallel
 
+# orjson은 선택적 (없으면 표준 json 사용)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def generate_summary(experiments: List[ExperimentData]) -> Dict[str, Any]:
+
+# 요격 실패 원인 한글 표기
+_FAILURE_REASON_MAP: Dict[str, str] = {
+    'evaded': '타겟 회피',
+    'distance_exceeded': '거리 초과',
+    'timeout': '시간 초과',
+    'low_speed': '속도 부족',
+    'sensor_error': '센서 오류',
+    'target_lost': '타겟 손실',
+}
+
+
+# 임계값 기반 개선 포인트 규칙
+# (지표 경로, 클수록 좋은지 여부, 경고 임계값, 개선 여지 임계값, 경고 / 개선 여지 / 양호 템플릿)
+# 템플릿이 None이면 해당 구간에서는 개선 포인트를 만들지 않음
+_ImprovementRule = Tuple[Tuple[str, ...], bool, float, float, Optional[str], Optional[str], Optional[str]]
+
+_IMPROVEMENT_RULES: List[_ImprovementRule] = [
+    (('interception', 'success_rate'), True, 50, 75,
+     "⚠️ 요격 성공률({v}%)이 낮음 - 요격 알고리즘 개선 필요",
+     "📊 요격 성공률({v}%) 개선 여지 있음",
+     "✅ 요격 성공률({v}%) 양호"),
+    (('detection', 'false_alarm_rate'), False, 5, 2,
+     "⚠️ 오탐률({v}%)이 높음 - 탐지 필터링 개선 필요",
+     "📊 오탐률({v}%) 모니터링 권장",
+     "✅ 오탐률({v}%) 양호"),
+    (('detection', 'detection_delay', 'mean'), False, 3, 1.5,
+     "⚠️ 평균 탐지 지연({v:.2f}초)이 길음 - 센서 감도 조정 필요",
+     "📊 탐지 지연({v:.2f}초) 개선 가능",
+     "✅ 탐지 지연({v:.2f}초) 양호"),
+    (('engagement', 'engaged_ratio'), True, 30, 30,
+     "⚠️ 교전 비율({v}%)이 낮음 - 교전 판단 기준 완화 검토", None, None),
+]
+
+# 요격 실패 원인 다음에 평가하는 규칙
+_NEUTRALIZATION_RULES: List[_ImprovementRule] = [
+    (('interception', 'neutralization_rate'), True, 20, 20,
+     "⚠️ 무력화율({v}%)이 낮음 - 전체적인 대응 능력 검토 필요", None, None),
+]
+
+
+def _apply_rules(metrics: Dict[str, Any], rules: List[_ImprovementRule]) -> List[str]:
+    """
+    임계값 규칙 테이블을 적용하여 개선 포인트 생성
+    
+    Args:
+        metrics: 집계된 지표 딕셔너리
+        rules: 개선 포인트 규칙 리스트
+        
+    Returns:
+        개선 포인트 문자열 리스트
+    """
+    points = []
+    for path, higher_is_better, warn, ok, t_warn, t_ok, t_good in rules:
+        value = reduce(operator.getitem, path[:-1], metrics).get(path[-1], 0)
+        if higher_is_better:
+            template = t_warn if value < warn else t_ok if value < ok else t_good
+        else:
+            template = t_warn if value > warn else t_ok if value > ok else t_good
+        if template is not None:
+            points.append(template.format(v=value))
+    return points
+
+
+def generate_summary(experiments: Iterable[ExperimentData]) -> Dict[str, Any]:
     """
     전체 실험 요약 생성
     
     Args:
-        experiments: ExperimentData 리스트
+        experiments: ExperimentData 리스트 또는 이터러블 (iter_all_experiments)
         
     Returns:
-        요약 딕셔너리
+        요약 딕셔너리 (실험이 없으면 metrics가 빈 딕셔너리)
     """
     individual_metrics, aggregated = calculate_all_metrics(experiments)
+    return build_summary(individual_metrics, aggregated)
+
+
+def generate_summary_parallel(
+    log_dir: str,
+    use_cache: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    전체 실험 요약 생성 (실험별 지표 계산을 프로세스 풀로 병렬 수행)
+    
+    Args:
+        log_dir: 로그 디렉토리 경로
+        use_cache: Parquet 캐시 사용 여부
+        max_workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+        
+    Returns:
+        요약 딕셔너리 (실험이 없으면 metrics가 빈 딕셔너리)
+    """
+    individual_metrics, aggregated = calculate_all_metrics_parallel(
+        log_dir, use_cache=use_cache, max_workers=max_workers
+    )
+    return build_summary(individual_metrics, aggregated)
+
+
+def build_summary(individual_metrics: List[ExperimentMetrics], aggregated: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    계산된 지표로 요약 딕셔너리 구성
     
+    Args:
+        individual_metrics: ExperimentMetrics 리스트
+        aggregated: 집계된 지표 딕셔너리
+        
+    Returns:
+        요약 딕셔너리
+    """
     # 개선 포인트 자동 생성
-    improvement_points = generate_improvement_points(aggregated)
+    improvement_points = generate_improvement_points(aggregated) if aggregated else []
     
     return {
         'generated_at': datetime.now().isoformat(),
@@ -44,6 +152,28 @@ def generate_summary(experiments: List[ExperimentData]) -> Dict[str, Any]:
     }
 
 
+def save_summary_json(summary: Dict[str, Any], output_path: str) -> None:
+    """
+    요약 딕셔너리를 JSON 파일로 저장
+    
+    orjson이 있으면 bytes로 직접 기록하고 (numpy 스칼라 포함),
+    없으면 표준 json으로 저장합니다.
+    
+    Args:
+        summary: 요약 딕셔너리
+        output_path: 출력 파일 경로
+    """
+    if HAS_ORJSON:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                summary,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
 def generate_improvement_points(metrics: Dict[str, Any]) -> List[str]:
     """
     분석 결과 기반 개선 포인트 자동 생성
@@ -54,59 +184,18 @@ def generate_improvement_points(metrics: Dict[str, Any]) -> List[str]:
     Returns:
         개선 포인트 문자열 리스트
     """
-    points = []
-    
-    # 요격 성공률 분석
-    success_rate = metrics['interception']['success_rate']
-    if success_rate < 50:
-        points.append(f"⚠️ 요격 성공률({success_rate}%)이 낮음 - 요격 알고리즘 개선 필요")
-    elif success_rate < 75:
-        points.append(f"📊 요격 성공률({success_rate}%) 개선 여지 있음")
-    else:
-        points.append(f"✅ 요격 성공률({success_rate}%) 양호")
-    
-    # 오탐률 분석
-    false_alarm_rate = metrics['detection']['false_alarm_rate']
-    if false_alarm_rate > 5:
-        points.append(f"⚠️ 오탐률({false_alarm_rate}%)이 높음 - 탐지 필터링 개선 필요")
-    elif false_alarm_rate > 2:
-        points.append(f"📊 오탐률({false_alarm_rate}%) 모니터링 권장")
-    else:
-        points.append(f"✅ 오탐률({false_alarm_rate}%) 양호")
-    
-    # 탐지 지연 분석
-    detection_delay = metrics['detection']['detection_delay'].get('mean', 0)
-    if detection_delay > 3:
-        points.append(f"⚠️ 평균 탐지 지연({detection_delay:.2f}초)이 길음 - 센서 감도 조정 필요")
-    elif detection_delay > 1.5:
-        points.append(f"📊 탐지 지연({detection_delay:.2f}초) 개선 가능")
-    else:
-        points.append(f"✅ 탐지 지연({detection_delay:.2f}초) 양호")
-    
-    # 교전 비율 분석
-    engaged_ratio = metrics['engagement']['engaged_ratio']
-    if engaged_ratio < 30:
-        points.append(f"⚠️ 교전 비율({engaged_ratio}%)이 낮음 - 교전 판단 기준 완화 검토")
+    # 요격 성공률 / 오탐률 / 탐지 지연 / 교전 비율 분석
+    points = _apply_rules(metrics, _IMPROVEMENT_RULES)
     
     # 요격 실패 원인 분석
     top_failures = metrics['interception'].get('top_failure_reasons', [])
     if top_failures:
         top_reason, top_count = top_failures[0]
-        reason_map = {
-            'evaded': '타겟 회피',
-            'distance_exceeded': '거리 초과',
-            'timeout': '시간 초과',
-            'low_speed': '속도 부족',
-            'sensor_error': '센서 오류',
-            'target_lost': '타겟 손실',
-        }
-        reason_name = reason_map.get(top_reason, top_reason)
+        reason_name = _FAILURE_REASON_MAP.get(top_reason, top_reason)
         points.append(f"📈 주요 요격 실패 원인: {reason_name} ({top_count}회)")
     
     # 무력화율 분석
-    neutralization_rate = metrics['interception']['neutralization_rate']
-    if neutralization_rate < 20:
-        points.append(f"⚠️ 무력화율({neutralization_rate}%)이 낮음 - 전체적인 대응 능력 검토 필요")
+    points.extend(_apply_rules(metrics, _NEUTRALIZATION_RULES))
     
     # 음향 탐지 상태
     if not metrics['detection']['audio_model_active']:
@@ -4,14 +4,40 @@
 최종 요약 결과를 생성하고 보고서를 출력합니다.
 """
 
-import json
 import os
+import sys
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
-from lib.loader import load_all_experiments, ExperimentData
+from lib.loader import iter_all_experiments, ExperimentData
 from lib.metrics import calculate_all_metrics, ExperimentMetrics
-from lib.summarize import generate_summary, generate_improvement_points
+from lib.summarize import generate_summary, generate_summary_parallel, generate_improvement_points, save_summary_json
+
+
+def print_summary_report(summary: Dict[str, Any], output_path: str) -> None:
+    """
+    요약 결과 콘솔 출력
+    
+    보고서 전체를 하나의 문자열로 만든 뒤 한 번에 출력합니다.
+    
+    Args:
+        summary: 요약 딕셔너리
+        output_path: 저장된 JSON 파일 경로
+    """
+    metrics = summary['metrics']
+    report = (
+        f"✅ 요약 생성 완료: {output_path}\n"
+        f"   실험 수: {metrics['experiment_count']}\n"
+        f"   요격 성공률: {metrics['interception']['success_rate']:.1f}%\n"
+    )
+    
+    # 개선 포인트
+    if summary['improvement_points']:
+        report += "\n📋 개선 포인트:\n" + "".join(
+            f"   {point}\n" for point in summary['improvement_points']
+        )
+    
+    sys.stdout.write(report)
 
 
 def main():
@@ -21,32 +47,27 @@ def main():
     parser = argparse.ArgumentParser(description='실험 결과 요약 생성')
     parser.add_argument('log_dir', type=str, help='로그 디렉토리 경로')
     parser.add_argument('--output', '-o', type=str, default='summary.json', help='출력 파일 경로')
+    parser.add_argument('--cache', action='store_true', help='파싱 결과 Parquet 캐시 사용 (pyarrow 필요)')
+    parser.add_argument('--workers', '-j', type=int, default=1, help='병렬 처리 프로세스 수 (0 = CPU 코어 수, 기본 1)')
     
     args = parser.parse_args()
     
-    # 실험 데이터 로드
-    experiments = load_all_experiments(args.log_dir)
+    # 실험 데이터 로드 및 요약 생성 (실험 단위 스트리밍 또는 프로세스 병렬)
+    if args.workers == 1:
+        summary = generate_summary(iter_all_experiments(args.log_dir, use_cache=args.cache))
+    else:
+        summary = generate_summary_parallel(
+            args.log_dir, use_cache=args.cache, max_workers=args.workers or None
+        )
     
-    if not experiments:
+    if not summary['metrics']:
         print(f"❌ {args.log_dir}에서 실험 데이터를 찾을 수 없습니다.")
         return
     
-    # 요약 생성
-    summary = generate_summary(experiments)
-    
     # JSON 저장
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    save_summary_json(summary, args.output)
     
-    print(f"✅ 요약 생성 완료: {args.output}")
-    print(f"   실험 수: {len(experiments)}")
-    print(f"   요격 성공률: {summary['metrics']['interception']['success_rate']:.1f}%")
-    
-    # 개선 포인트 출력
-    if summary['improvement_points']:
-        print("\n📋 개선 포인트:")
-        for point in summary['improvement_points']:
-            print(f"   {point}")
+    print_summary_report(summary, args.output)
 
 
 if __name__ == '__main__':
@@ -16,16 +16,34 @@
 실제 모델 학습 및 추론은 별도 구현 필요.
 """
 
+import logging
+import math
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 import random
 
+# librosa는 mel 필터뱅크 생성에만 사용 (없으면 더미 mel-spectrogram)
+try:
+    import librosa
+    HAS_LIBROSA = True
+except ImportError:
+    HAS_LIBROSA = False
+
+# numba는 선택적 (있으면 배치 탐지 커널을 JIT 컴파일)
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
 # 실제 구현시 사용
-# import librosa
 # import tensorflow as tf
 
+logger = logging.getLogger(__name__)
+
 
 class DroneActivityState(Enum):
     """드론 활동 상태"""
@@ -86,10 +104,24 @@ class DroneAudioCRNN:
         self.model_path = model_path
         self.model = None
         
+        # STFT/mel 변환 상수는 한 번만 계산 (추론마다 재생성하지 않음)
+        self._n_samples = int(self.WINDOW_SECONDS * self.SAMPLE_RATE)
+        self._n_frames = 1 + self._n_samples // self.HOP_LENGTH
+        # librosa와 같은 periodic Hann 윈도우 (np.hanning은 symmetric)
+        self._window = np.hanning(self.N_FFT + 1)[:-1].astype(np.float32)
+        self._mel_fb: Optional[np.ndarray] = None
+        if HAS_LIBROSA:
+            self._mel_fb = librosa.filters.mel(
+                sr=self.SAMPLE_RATE, n_fft=self.N_FFT, n_mels=self.N_MELS
+            ).astype(np.float32)
+        
+        # 모델 입력 버퍼 (B, mel, time, 1) - 추론마다 재할당하지 않고 재사용
+        self._mel_buf = np.empty((1, self.N_MELS, self._n_frames, 1), dtype=np.float32)
+        
         if model_path:
             self._load_model(model_path)
         else:
-            print("[AudioModel] 더미 모드로 실행 (실제 모델 없음)")
+            logger.info("[AudioModel] 더미 모드로 실행 (실제 모델 없음)")
     
     def _load_model(self, path: str) -> None:
         """
@@ -101,7 +133,7 @@ class DroneAudioCRNN:
         ```
         """
         # STUB: 실제 모델 로드
-        print(f"[AudioModel] 모델 로드: {path}")
+        logger.info(f"[AudioModel] 모델 로드: {path}")
         # self.model = tf.keras.models.load_model(path)
     
     def _build_model(self) -> None:
@@ -143,22 +175,70 @@ class DroneAudioCRNN:
         """
         오디오에서 Mel-Spectrogram 추출
         
-        실제 구현 예시:
-        ```python
-        mel = librosa.feature.melspectrogram(
-            y=audio,
-            sr=self.SAMPLE_RATE,
-            n_mels=self.N_MELS,
-            n_fft=self.N_FFT,
-            hop_length=self.HOP_LENGTH
-        )
-        mel_db = librosa.power_to_db(mel, ref=np.max)
-        return mel_db
-        ```
+        Args:
+            audio: 오디오 샘플 (1D numpy array)
+            
+        Returns:
+            (N_MELS, n_frames) dB 스케일 mel-spectrogram
         """
-        # STUB: 더미 mel-spectrogram
-        n_frames = int(self.WINDOW_SECONDS * self.SAMPLE_RATE / self.HOP_LENGTH)
-        return np.random.randn(self.N_MELS, n_frames)
+        return self._extract_mel_batch(np.asarray(audio)[np.newaxis])[0]
+    
+    def _mel_buffer(self, batch_size: int) -> np.ndarray:
+        """
+        (batch_size, N_MELS, n_frames, 1) 모델 입력 버퍼 반환
+        
+        내부 버퍼의 뷰이므로 다음 추론 호출 시 덮어써집니다.
+        더 큰 배치가 들어오면 버퍼를 확장합니다.
+        """
+        if self._mel_buf.shape[0] < batch_size:
+            self._mel_buf = np.empty((batch_size, self.N_MELS, self._n_frames, 1), dtype=np.float32)
+        return self._mel_buf[:batch_size]
+    
+    def _extract_mel_batch(self, audios: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        여러 오디오 윈도우의 Mel-Spectrogram 일괄 추출
+        
+        librosa.feature.melspectrogram(center=True, pad_mode='constant') +
+        power_to_db(ref=np.max)와 같은 처리를 배치 전체에 대해 한 번의 rfft로
+        수행합니다 (_check_mel_against_librosa로 확인).
+        
+        Args:
+            audios: (B, T) 오디오 배치 (T는 3초 윈도우로 자르거나 0으로 채움)
+            out: 결과를 기록할 (B, N_MELS, n_frames) float32 배열 (없으면 새로 할당)
+            
+        Returns:
+            (B, N_MELS, n_frames) dB 스케일 mel-spectrogram (out이 있으면 out)
+        """
+        batch_size = audios.shape[0]
+        if out is None:
+            out = np.empty((batch_size, self.N_MELS, self._n_frames), dtype=np.float32)
+        
+        if self._mel_fb is None:
+            # STUB: librosa 없음 → 더미 mel-spectrogram
+            out[...] = np.random.randn(batch_size, self.N_MELS, self._n_frames)
+            return out
+        
+        # 3초 윈도우로 길이 고정 후 center 패딩 (librosa>=0.10 기본값: 0 패딩)
+        fixed = np.zeros((batch_size, self._n_samples), dtype=np.float32)
+        length = min(audios.shape[1], self._n_samples)
+        fixed[:, :length] = audios[:, :length]
+        pad = self.N_FFT // 2
+        padded = np.pad(fixed, ((0, 0), (pad, pad)), mode='constant')
+        
+        # (B, n_frames, N_FFT) 프레임 뷰 (복사 없음)
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self.N_FFT, axis=-1)
+        frames = frames[:, ::self.HOP_LENGTH] * self._window
+        
+        power = np.abs(np.fft.rfft(frames, axis=-1)) ** 2  # (B, n_frames, N_FFT//2 + 1)
+        np.matmul(self._mel_fb, power.transpose(0, 2, 1), out=out)  # (B, N_MELS, n_frames)
+        
+        # power_to_db(ref=np.max, top_db=80) - out 버퍼에서 in-place 계산
+        np.maximum(out, 1e-10, out=out)
+        np.log10(out, out=out)
+        out *= 10.0
+        out -= out.max(axis=(1, 2), keepdims=True)
+        np.maximum(out, -80.0, out=out)
+        return out
     
     def predict(self, audio: np.ndarray) -> Tuple[DroneActivityState, float]:
         """
@@ -170,24 +250,37 @@ class DroneAudioCRNN:
         Returns:
             (예측 상태, 신뢰도)
         """
-        if self.model is not None:
-            # 실제 모델 추론
-            mel = self._extract_mel_spectrogram(audio)
-            mel = mel[np.newaxis, ..., np.newaxis]  # (1, mel, time, 1)
-            
-            # predictions = self.model.predict(mel)
-            # class_idx = np.argmax(predictions[0])
-            # confidence = predictions[0][class_idx]
+        return self.predict_batch(np.asarray(audio)[np.newaxis])[0]
+    
+    def predict_batch(self, audios: np.ndarray) -> List[Tuple[DroneActivityState, float]]:
+        """
+        여러 오디오 윈도우의 드론 활동 상태를 한 번의 추론으로 예측
+        
+        Args:
+            audios: (B, T) 오디오 배치
             
-            # STUB
-            class_idx = random.randint(0, 5)
-            confidence = random.uniform(0.6, 0.95)
-        else:
-            # 더미 모드: 랜덤 예측
-            class_idx = random.randint(0, 5)
-            confidence = random.uniform(0.5, 0.95)
+        Returns:
+            [(예측 상태, 신뢰도), ...] (길이 B)
+        """
+        batch_size = audios.shape[0]
         
-        return self.CLASSES[class_idx], confidence
+        if self.model is not None:
+            # 실제 모델 추론 (단일 forward pass)
+            mel = self._mel_buffer(batch_size)  # (B, mel, time, 1)
+            self._extract_mel_batch(audios, out=mel[..., 0])
+            predictions = self.model.predict(mel, verbose=0)
+            class_idx = np.argmax(predictions, axis=1)
+            confidence = predictions[np.arange(batch_size), class_idx]
+            return [
+                (self.CLASSES[int(i)], float(c))
+                for i, c in zip(class_idx, confidence)
+            ]
+        
+        # 더미 모드: 랜덤 예측
+        return [
+            (self.CLASSES[random.randint(0, 5)], random.uniform(0.5, 0.95))
+            for _ in range(batch_size)
+        ]
     
     def predict_from_file(self, wav_path: str) -> Tuple[DroneActivityState, float]:
         """
@@ -203,6 +296,108 @@ class DroneAudioCRNN:
         return self.predict(np.array([]))
 
 
+# 배치 커널용 상태 인덱스 (DroneAudioCRNN.CLASSES 기준)
+_TAKEOFF_IDX = DroneAudioCRNN.CLASSES.index(DroneActivityState.TAKEOFF)
+_HOVER_IDX = DroneAudioCRNN.CLASSES.index(DroneActivityState.HOVER)
+_APPROACH_IDX = DroneAudioCRNN.CLASSES.index(DroneActivityState.APPROACH)
+_DEPART_IDX = DroneAudioCRNN.CLASSES.index(DroneActivityState.DEPART)
+
+
+def _batch_detect_numpy(pos, vel, base, range_factors, conf_base, max_range, u, n_conf, n_dist, n_bear):
+    """
+    배치 탐지 커널 (NumPy 벡터화 버전)
+    
+    Returns:
+        (state_idx, detected, confidence, estimated_distance, estimated_bearing) 배열 튜플
+    """
+    # 거리 / 속도 / 접근 속도
+    delta = pos - base
+    distance = np.linalg.norm(delta, axis=1)
+    speed = np.linalg.norm(vel[:, :2], axis=1)
+    climb_rate = vel[:, 2]
+    closing_speed = -(delta[:, 0] * vel[:, 0] + delta[:, 1] * vel[:, 1]) / np.maximum(distance, 1)
+    
+    # 상태 추정 (simulate_detection의 if/elif 순서를 서로 배타적인 마스크로 표현)
+    m_hover = speed < 1
+    m_takeoff = ~m_hover & (climb_rate > 3)
+    m_depart_climb = ~m_hover & ~m_takeoff & (climb_rate < -3)
+    remaining = ~(m_hover | m_takeoff | m_depart_climb)
+    m_approach = remaining & (closing_speed > 5)
+    m_depart_close = remaining & (closing_speed < -5)
+    
+    # 나머지(호버 / 접근 속도 ±5 이내)는 default=HOVER
+    state_idx = np.select(
+        [m_takeoff, m_depart_climb | m_depart_close, m_approach],
+        [_TAKEOFF_IDX, _DEPART_IDX, _APPROACH_IDX],
+        default=_HOVER_IDX,
+    )
+    
+    # 탐지 확률 / 신뢰도
+    detection_prob = range_factors[state_idx] * (1 - distance / max_range)
+    detected = (distance <= max_range) & (u <= detection_prob)
+    
+    confidence = conf_base[state_idx] * (1 - 0.3 * distance / max_range)
+    confidence = np.clip(confidence + n_conf, 0.4, 0.95)
+    
+    # 방위각 / 노이즈 추가
+    bearing = np.degrees(np.arctan2(delta[:, 0], delta[:, 1])) % 360
+    return state_idx, detected, confidence, distance + n_dist, bearing + n_bear
+
+
+def _batch_detect_loop(pos, vel, base, range_factors, conf_base, max_range, u, n_conf, n_dist, n_bear):
+    """
+    배치 탐지 커널 (스칼라 루프 버전, numba JIT 컴파일 대상)
+    
+    _batch_detect_numpy와 같은 결과를 드론별 스칼라 연산으로 계산합니다.
+    """
+    n = pos.shape[0]
+    state_idx = np.empty(n, dtype=np.int64)
+    detected = np.empty(n, dtype=np.bool_)
+    confidence = np.empty(n, dtype=np.float64)
+    estimated_distance = np.empty(n, dtype=np.float64)
+    estimated_bearing = np.empty(n, dtype=np.float64)
+    
+    for i in prange(n):
+        dx = pos[i, 0] - base[0]
+        dy = pos[i, 1] - base[1]
+        dz = pos[i, 2] - base[2]
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        speed = math.sqrt(vel[i, 0] * vel[i, 0] + vel[i, 1] * vel[i, 1])
+        climb_rate = vel[i, 2]
+        
+        if speed < 1:
+            state = _HOVER_IDX
+        elif climb_rate > 3:
+            state = _TAKEOFF_IDX
+        elif climb_rate < -3:
+            state = _DEPART_IDX
+        else:
+            closing_speed = -(dx * vel[i, 0] + dy * vel[i, 1]) / max(distance, 1.0)
+            if closing_speed > 5:
+                state = _APPROACH_IDX
+            elif closing_speed < -5:
+                state = _DEPART_IDX
+            else:
+                state = _HOVER_IDX
+        
+        detection_prob = range_factors[state] * (1 - distance / max_range)
+        conf = conf_base[state] * (1 - 0.3 * distance / max_range) + n_conf[i]
+        
+        state_idx[i] = state
+        detected[i] = distance <= max_range and u[i] <= detection_prob
+        confidence[i] = min(0.95, max(0.4, conf))
+        estimated_distance[i] = distance + n_dist[i]
+        estimated_bearing[i] = math.degrees(math.atan2(dx, dy)) % 360 + n_bear[i]
+    
+    return state_idx, detected, confidence, estimated_distance, estimated_bearing
+
+
+if HAS_NUMBA:
+    _batch_detect = njit(parallel=True, fastmath=True, cache=True)(_batch_detect_loop)
+else:
+    _batch_detect = _batch_detect_numpy
+
+
 class AudioSensorSimulator:
     """
     음향 센서 시뮬레이터
@@ -224,9 +419,20 @@ class AudioSensorSimulator:
         DroneActivityState.DEPART: {"range_factor": 0.6, "confidence_base": 0.70},
     }
     
+    # 배치 커널용 상태별 특성 배열 (DroneAudioCRNN.CLASSES 순서로 인덱싱)
+    _RANGE_FACTORS = np.array(
+        [c["range_factor"] for c in map(STATE_CHARACTERISTICS.get, DroneAudioCRNN.CLASSES)],
+        dtype=np.float32,
+    )
+    _CONF_BASE = np.array(
+        [c["confidence_base"] for c in map(STATE_CHARACTERISTICS.get, DroneAudioCRNN.CLASSES)],
+        dtype=np.float32,
+    )
+    
     def __init__(self, model: Optional[DroneAudioCRNN] = None):
         self.model = model or DroneAudioCRNN()
         self.detected_drones: dict = {}
+        self._rng = np.random.default_rng()
     
     def simulate_detection(
         self,
@@ -251,14 +457,14 @@ class AudioSensorSimulator:
         dx = drone_position[0] - base_position[0]
         dy = drone_position[1] - base_position[1]
         dz = drone_position[2] - base_position[2]
-        distance = np.sqrt(dx**2 + dy**2 + dz**2)
+        distance = math.hypot(dx, dy, dz)
         
         # 탐지 범위 체크
         if distance > self.MAX_DETECTION_RANGE:
             return None
         
         # 드론 상태 추정
-        speed = np.sqrt(drone_velocity[0]**2 + drone_velocity[1]**2)
+        speed = math.hypot(drone_velocity[0], drone_velocity[1])
         climb_rate = drone_velocity[2]
         
         # 속도/접근 방향으로 상태 추정
@@ -290,7 +496,7 @@ class AudioSensorSimulator:
         confidence = max(0.4, min(0.95, confidence + random.gauss(0, 0.1)))
         
         # 방위각 계산
-        bearing = np.degrees(np.arctan2(dx, dy)) % 360
+        bearing = math.degrees(math.atan2(dx, dy)) % 360
         
         return AudioDetectionResult(
             drone_id=drone_id,
@@ -300,15 +506,94 @@ class AudioSensorSimulator:
             estimated_bearing=bearing + random.gauss(0, 10),
         )
 
+    
+    def simulate_detection_batch(
+        self,
+        drone_ids: Sequence[str],
+        positions: np.ndarray,   # (N, 3) x, y, altitude
+        velocities: np.ndarray,  # (N, 3) vx, vy, climb_rate
+        base_position: Tuple[float, float, float] = (0, 0, 50)
+    ) -> List[AudioDetectionResult]:
+        """
+        여러 드론에 대한 음향 탐지 시뮬레이션 (벡터화 버전)
+        
+        simulate_detection과 같은 규칙을 N개 드론에 대해 한 번에 계산합니다.
+        
+        Args:
+            drone_ids: 드론 ID 목록 (길이 N)
+            positions: 드론 3D 위치 배열
+            velocities: 드론 3D 속도 배열
+            base_position: 기지 위치
+            
+        Returns:
+            탐지된 드론의 결과 리스트
+        """
+        n = len(drone_ids)
+        if n == 0:
+            return []
+        
+        positions = np.asarray(positions, dtype=np.float32)
+        velocities = np.asarray(velocities, dtype=np.float32)
+        base = np.asarray(base_position, dtype=np.float32)
+        
+        # 난수는 틱당 한 번에 생성
+        u = self._rng.random(n)
+        n_conf = self._rng.normal(0, 0.1, n)
+        n_dist = self._rng.normal(0, 30, n)
+        n_bear = self._rng.normal(0, 10, n)
+        
+        state_idx, detected, confidence, estimated_distance, estimated_bearing = _batch_detect(
+            positions, velocities, base,
+            self._RANGE_FACTORS, self._CONF_BASE, float(self.MAX_DETECTION_RANGE),
+            u, n_conf, n_dist, n_bear,
+        )
+        
+        # 탐지된 행에 대해서만 결과 객체 생성
+        classes = DroneAudioCRNN.CLASSES
+        return [
+            AudioDetectionResult(
+                drone_id=str(drone_ids[i]),
+                state=classes[state_idx[i]],
+                confidence=float(confidence[i]),
+                estimated_distance=float(estimated_distance[i]),
+                estimated_bearing=float(estimated_bearing[i]),
+            )
+            for i in np.flatnonzero(detected)
+        ]
+
+
+def _check_mel_against_librosa(model: DroneAudioCRNN, atol_db: float = 1e-3) -> float:
+    """
+    _extract_mel_spectrogram 결과를 librosa 기준 구현과 비교
+    
+    Returns:
+        최대 절대 오차 (dB)
+        
+    Raises:
+        AssertionError: 오차가 atol_db를 넘는 경우
+    """
+    audio = np.random.default_rng(0).standard_normal(model._n_samples).astype(np.float32)
+    mel = librosa.feature.melspectrogram(
+        y=audio, sr=model.SAMPLE_RATE, n_fft=model.N_FFT,
+        hop_length=model.HOP_LENGTH, n_mels=model.N_MELS,
+    )
+    expected = librosa.power_to_db(mel, ref=np.max)
+    max_diff = float(np.abs(model._extract_mel_spectrogram(audio) - expected).max())
+    assert max_diff <= atol_db, f"mel-spectrogram 불일치: 최대 {max_diff:.2e} dB"
+    return max_diff
+
 
 # CLI 테스트
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("=== 드론 음향 감지 모델 테스트 ===\n")
     
     # 모델 테스트
     model = DroneAudioCRNN()
     state, conf = model.predict(np.random.randn(22050 * 3))
     print(f"[Model] 예측 상태: {state.value}, 신뢰도: {conf:.2f}")
+    if HAS_LIBROSA:
+        print(f"[Model] librosa 대비 mel 최대 오차: {_check_mel_against_librosa(model):.2e} dB")
     
     # 시뮬레이터 테스트
     simulator = AudioSensorSimulator(model)
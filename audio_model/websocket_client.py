@@ -5,10 +5,14 @@ C2 시뮬레이터에 음향 탐지 이벤트 전송
 """
 
 import asyncio
-import json
+import logging
+import logging.handlers
+import queue
 import random
 import time
-from typing import Optional
+from typing import Dict, List, Optional
+import msgspec
+import numpy as np
 import websockets
 
 from model import (
@@ -19,6 +23,83 @@ from model import (
 )
 
 
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    비동기 루프를 막지 않는 콘솔 로깅 설정
+    
+    로그 레코드는 QueueHandler로 큐에 넣기만 하고, 실제 출력은
+    QueueListener 백그라운드 스레드가 담당합니다.
+    
+    Returns:
+        시작된 QueueListener (종료 시 stop() 호출 필요)
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener.start()
+    return listener
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# WebSocket 메시지 스키마 (msgspec)
+# ============================================
+
+class AudioDetectionEvent(msgspec.Struct, tag="audio_detection", tag_field="type"):
+    """
+    송신: 음향 탐지 이벤트
+    
+    모델의 AudioDetectionResult와 별도인 와이어 스키마입니다. 이벤트마다
+    type/timestamp 필드와 반올림된 값이 필요하고, model.py가 msgspec에
+    의존하지 않도록 결과 객체는 dataclass로 둡니다.
+    """
+    timestamp: float
+    drone_id: str
+    state: DroneActivityState
+    confidence: float
+    estimated_distance: Optional[float] = None
+    estimated_bearing: Optional[float] = None
+
+
+class AudioDetectionBatch(msgspec.Struct, tag="audio_detection_batch", tag_field="type"):
+    """송신: 한 틱의 음향 탐지 이벤트 묶음"""
+    timestamp: float
+    events: List[AudioDetectionEvent]
+
+
+class ServerMessage(msgspec.Struct):
+    """수신: 메시지 타입 확인용 헤더 (나머지 필드는 무시)"""
+    type: str = "unknown"
+
+
+class DronePosition(msgspec.Struct):
+    x: float = 0
+    y: float = 0
+    altitude: float = 0
+
+
+class DroneVelocity(msgspec.Struct):
+    vx: float = 0
+    vy: float = 0
+    climb_rate: float = msgspec.field(default=0, name="climbRate")
+
+
+class DroneStateUpdate(msgspec.Struct):
+    """수신: drone_state_update 메시지"""
+    drone_id: str = ""
+    position: Optional[DronePosition] = None
+    velocity: Optional[DroneVelocity] = None
+
+
 class AudioModelClient:
     """
     음향 모델 WebSocket 클라이언트
@@ -40,11 +121,14 @@ class AudioModelClient:
         self.model = DroneAudioCRNN()
         self.simulator = AudioSensorSimulator(self.model)
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self._encoder = msgspec.json.Encoder()
+        self._header_decoder = msgspec.json.Decoder(ServerMessage)
+        self._state_update_decoder = msgspec.json.Decoder(DroneStateUpdate)
         self.is_running = False
         
         # 시뮬레이션용 더미 드론 데이터
         # 실제로는 시뮬레이터로부터 드론 위치 수신
-        self.simulated_drones = [
+        simulated_drones = [
             {
                 "id": "AUDIO-SIM-001",
                 "position": [300, 250, 80],
@@ -56,15 +140,21 @@ class AudioModelClient:
                 "velocity": [3, -5, -1],
             },
         ]
+        
+        # 병렬 배열 (N, 3)로 보관 → 틱당 한 번에 위치 갱신
+        self._ids = np.array([d["id"] for d in simulated_drones])
+        self._pos = np.array([d["position"] for d in simulated_drones], dtype=np.float32)
+        self._vel = np.array([d["velocity"] for d in simulated_drones], dtype=np.float32)
+        self._id_to_index: Dict[str, int] = {d["id"]: i for i, d in enumerate(simulated_drones)}
     
     async def connect(self) -> bool:
         """서버에 연결"""
         try:
             self.websocket = await websockets.connect(self.server_url)
-            print(f"[AudioClient] 서버 연결 성공: {self.server_url}")
+            logger.info(f"[AudioClient] 서버 연결 성공: {self.server_url}")
             return True
         except Exception as e:
-            print(f"[AudioClient] 연결 실패: {e}")
+            logger.error(f"[AudioClient] 연결 실패: {e}")
             return False
     
     async def disconnect(self):
@@ -72,50 +162,70 @@ class AudioModelClient:
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
-            print("[AudioClient] 연결 해제")
+            logger.info("[AudioClient] 연결 해제")
+    
+    @staticmethod
+    def _detection_event(result: AudioDetectionResult, timestamp: float) -> AudioDetectionEvent:
+        """탐지 결과 → audio_detection 이벤트"""
+        return AudioDetectionEvent(
+            timestamp=timestamp,
+            drone_id=result.drone_id,
+            state=result.state,
+            confidence=round(result.confidence, 2),
+            estimated_distance=round(result.estimated_distance, 1) if result.estimated_distance else None,
+            estimated_bearing=round(result.estimated_bearing, 1) if result.estimated_bearing else None,
+        )
     
     async def send_detection_event(self, result: AudioDetectionResult):
         """탐지 이벤트 전송"""
         if not self.websocket:
             return
         
-        event = {
-            "type": "audio_detection",
-            "timestamp": time.time(),
-            "drone_id": result.drone_id,
-            "state": result.state.value,
-            "confidence": round(result.confidence, 2),
-            "estimated_distance": round(result.estimated_distance, 1) if result.estimated_distance else None,
-            "estimated_bearing": round(result.estimated_bearing, 1) if result.estimated_bearing else None,
-        }
+        event = self._detection_event(result, time.time())
         
         try:
-            await self.websocket.send(json.dumps(event))
-            print(f"[AudioClient] 이벤트 전송: {result.drone_id} - {result.state.value}")
+            await self.websocket.send(self._encoder.encode(event))
+            logger.info(f"[AudioClient] 이벤트 전송: {result.drone_id} - {result.state.value}")
         except Exception as e:
-            print(f"[AudioClient] 전송 실패: {e}")
+            logger.error(f"[AudioClient] 전송 실패: {e}")
+    
+    async def send_detection_batch(self, results: List[AudioDetectionResult]):
+        """
+        한 틱의 탐지 이벤트를 하나의 audio_detection_batch 프레임으로 전송
+        
+        드론 수만큼 send를 반복하지 않고 직렬화/프레이밍을 한 번만 수행합니다.
+        """
+        if not self.websocket or not results:
+            return
+        
+        timestamp = time.time()
+        batch = AudioDetectionBatch(
+            timestamp=timestamp,
+            events=[self._detection_event(result, timestamp) for result in results],
+        )
+        
+        try:
+            await self.websocket.send(self._encoder.encode(batch))
+            logger.info(f"[AudioClient] 이벤트 일괄 전송: {len(results)}건")
+        except Exception as e:
+            logger.error(f"[AudioClient] 전송 실패: {e}")
     
     async def detection_loop(self):
         """탐지 루프 실행"""
         self.is_running = True
         
         while self.is_running:
-            # 각 시뮬레이션 드론에 대해 탐지 시도
-            for drone in self.simulated_drones:
-                # 위치 업데이트 (시뮬레이션)
-                drone["position"][0] += drone["velocity"][0] * self.detection_interval
-                drone["position"][1] += drone["velocity"][1] * self.detection_interval
-                drone["position"][2] += drone["velocity"][2] * self.detection_interval
-                
-                # 탐지 시도
-                result = self.simulator.simulate_detection(
-                    drone_id=drone["id"],
-                    drone_position=tuple(drone["position"]),
-                    drone_velocity=tuple(drone["velocity"]),
-                )
-                
-                if result:
-                    await self.send_detection_event(result)
+            # 위치 업데이트 (시뮬레이션)
+            self._pos += self._vel * self.detection_interval
+            
+            # 전체 시뮬레이션 드론에 대해 일괄 탐지 시도
+            results = self.simulator.simulate_detection_batch(
+                drone_ids=self._ids,
+                positions=self._pos,
+                velocities=self._vel,
+            )
+            
+            await self.send_detection_batch(results)
             
             await asyncio.sleep(self.detection_interval)
     
@@ -126,28 +236,32 @@ class AudioModelClient:
         
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                print(f"[AudioClient] 서버 메시지: {data.get('type', 'unknown')}")
-                
-                # 드론 상태 업데이트 수신 시 시뮬레이션 데이터 갱신
-                if data.get("type") == "drone_state_update":
-                    self._update_simulated_drone(data)
+                try:
+                    header = self._header_decoder.decode(message)
+                    logger.info(f"[AudioClient] 서버 메시지: {header.type}")
+                    
+                    # 드론 상태 업데이트 수신 시 시뮬레이션 데이터 갱신
+                    if header.type == "drone_state_update":
+                        self._update_simulated_drone(self._state_update_decoder.decode(message))
+                except msgspec.DecodeError as e:
+                    logger.warning(f"[AudioClient] 메시지 파싱 실패: {e}")
                     
         except websockets.exceptions.ConnectionClosed:
-            print("[AudioClient] 연결 끊김")
+            logger.warning("[AudioClient] 연결 끊김")
             self.is_running = False
     
-    def _update_simulated_drone(self, data: dict):
+    def _update_simulated_drone(self, update: DroneStateUpdate):
         """시뮬레이션 드론 데이터 업데이트"""
-        drone_id = data.get("drone_id")
-        for drone in self.simulated_drones:
-            if drone["id"] == drone_id:
-                if "position" in data:
-                    pos = data["position"]
-                    drone["position"] = [pos.get("x", 0), pos.get("y", 0), pos.get("altitude", 0)]
-                if "velocity" in data:
-                    vel = data["velocity"]
-                    drone["velocity"] = [vel.get("vx", 0), vel.get("vy", 0), vel.get("climbRate", 0)]
+        idx = self._id_to_index.get(update.drone_id)
+        if idx is None:
+            return
+        
+        if update.position is not None:
+            pos = update.position
+            self._pos[idx] = (pos.x, pos.y, pos.altitude)
+        if update.velocity is not None:
+            vel = update.velocity
+            self._vel[idx] = (vel.vx, vel.vy, vel.climb_rate)
     
     async def run(self):
         """클라이언트 실행"""
@@ -161,7 +275,7 @@ class AudioModelClient:
                 self.listen_for_commands(),
             )
         except KeyboardInterrupt:
-            print("\n[AudioClient] 종료 중...")
+            logger.info("\n[AudioClient] 종료 중...")
         finally:
             self.is_running = False
             await self.disconnect()
@@ -176,13 +290,15 @@ async def main():
     server_url = os.getenv('AUDIO_MODEL_WS_URL', 'ws://localhost:8080')
     detection_interval = float(os.getenv('AUDIO_DETECTION_INTERVAL', '2.0'))
     
-    client = AudioModelClient(
-        server_url=server_url,
-        detection_interval=detection_interval,
-        detection_interval=2.0,
-    )
-    
-    await client.run()
+    listener = setup_logging()
+    try:
+        client = AudioModelClient(
+            server_url=server_url,
+            detection_interval=detection_interval,
+        )
+        await client.run()
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":